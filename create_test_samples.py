@@ -3,122 +3,91 @@
 Multiple test PCAP samples for different testing scenarios
 """
 
-import struct
 import time
 import random
 import math
+from itertools import product
 
-def create_pcap_global_header():
-    """Create PCAP global header"""
-    magic = 0xa1b2c3d4  # Little endian
-    version_major = 2
-    version_minor = 4
-    thiszone = 0
-    sigfigs = 0
-    snaplen = 65535
-    network = 1  # Ethernet
-    
-    return struct.pack('<LHHLLLL', 
-                      magic, version_major, version_minor, 
-                      thiszone, sigfigs, snaplen, network)
-
-def create_packet_header(packet_data, timestamp):
-    """Create packet header"""
-    ts_sec = int(timestamp)
-    ts_usec = int((timestamp - ts_sec) * 1000000)
-    caplen = len(packet_data)
-    origlen = caplen
-    
-    return struct.pack('<LLLL', ts_sec, ts_usec, caplen, origlen)
-
-def create_ethernet_header(src_mac="00:11:22:33:44:55", dst_mac="aa:bb:cc:dd:ee:ff"):
-    """Create Ethernet header"""
-    def mac_to_bytes(mac_str):
-        return bytes.fromhex(mac_str.replace(':', ''))
-    
-    dst = mac_to_bytes(dst_mac)
-    src = mac_to_bytes(src_mac) 
-    ethertype = 0xaefe  # eCPRI
-    
-    return dst + src + struct.pack('>H', ethertype)
-
-def create_ecpri_header(message_type=0, rtc_id=0x1234, seq_id=0, payload_size=0):
-    """Create eCPRI header"""
-    # Byte 0: Version(4) + Reserved(1) + C(1) + Message Type(2)
-    byte0 = (1 << 4) | (0 << 3) | (0 << 2) | (message_type & 0x03)
-    
-    header = struct.pack('>BHHH', 
-                        byte0, payload_size, rtc_id, seq_id)
-    
-    return header
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure-Python loops
+    np = None
 
-def create_oran_header(frame_id=0, subframe_id=0, slot_id=0, symbol_id=0, 
-                      section_id=0, start_prbu=0, num_prbu=273):
-    """Create O-RAN U-plane header"""
-    # Byte 0: dataDirection(1) + payloadVersion(3) + filterIndex(4)
-    byte0 = (0 << 7) | (1 << 4) | (0 & 0x0f)
-    
-    # Byte 2: subframeId(4) + slotId(4) 
-    byte2 = (subframe_id << 4) | (slot_id & 0x0f)
-    
-    # Byte 3: symbolId(6) + reserved(2)
-    byte3 = (symbol_id << 2) | 0
-    
-    # Section fields (4 bytes)
-    # sectionId(12) + rb(1) + symInc(1) + startPrbu(10) + numPrbu(8)
-    section_fields = (section_id << 20) | (1 << 19) | (0 << 18) | (start_prbu << 8) | num_prbu
-    
-    return struct.pack('>BBBB', byte0, frame_id, byte2, byte3) + struct.pack('>L', section_fields)
+from pcap_builders import (
+    IQ_SAMPLE, create_pcap_global_header, create_packet_header,
+    create_ethernet_header, create_ecpri_header, create_oran_header,
+)
 
 def generate_iq_samples_with_pattern(num_samples, pattern="sine"):
     """Generate different IQ sample patterns"""
-    samples = []
+    if pattern == "noise" and np is not None:
+        # Draw all I/Q values in one call; seeded from `random` so random.seed() still applies
+        rng = np.random.default_rng(random.getrandbits(64))
+        iq = rng.integers(-5000, 5000 + 1, size=num_samples * 2, dtype=np.int16)
+        return iq.astype('>i2').tobytes()
+    
+    if pattern == "chirp" and np is not None:
+        # Linear sweep from 10 to 100: freq * t = 10t + 90t^2, a quadratic phase
+        t = np.arange(num_samples, dtype=np.float64) / num_samples
+        phase = 2 * np.pi * (10 * t + 90 * t * t)
+        iq = np.empty((num_samples, 2), dtype='>i2')
+        iq[:, 0] = 3000 * np.cos(phase)
+        iq[:, 1] = 3000 * np.sin(phase)
+        return iq.tobytes()
+    
+    samples = bytearray(num_samples * IQ_SAMPLE.size)
+    # Bind hot-loop lookups to locals
+    pack_into = IQ_SAMPLE.pack_into
+    randint = random.randint
+    cos, sin = math.cos, math.sin
+    tau = 2 * math.pi
     
     for i in range(num_samples):
         if pattern == "sine":
             # Sine wave
-            t = i / num_samples * 4 * math.pi
+            t = i / num_samples * 2 * tau
             amplitude = 2000
-            i_sample = int(amplitude * math.cos(t))
-            q_sample = int(amplitude * math.sin(t))
+            i_sample = int(amplitude * cos(t))
+            q_sample = int(amplitude * sin(t))
         elif pattern == "noise":
             # Random noise
-            i_sample = random.randint(-5000, 5000)
-            q_sample = random.randint(-5000, 5000)
+            i_sample = randint(-5000, 5000)
+            q_sample = randint(-5000, 5000)
         elif pattern == "chirp":
             # Frequency chirp
             t = i / num_samples
             freq = 10 + 90 * t  # Frequency sweep from 10 to 100
             amplitude = 3000
-            i_sample = int(amplitude * math.cos(2 * math.pi * freq * t))
-            q_sample = int(amplitude * math.sin(2 * math.pi * freq * t))
+            i_sample = int(amplitude * cos(tau * freq * t))
+            q_sample = int(amplitude * sin(tau * freq * t))
         elif pattern == "low_power":
             # Low power signal
-            t = i / num_samples * 2 * math.pi
+            t = i / num_samples * tau
             amplitude = 100
-            i_sample = int(amplitude * math.cos(t))
-            q_sample = int(amplitude * math.sin(t))
+            i_sample = int(amplitude * cos(t))
+            q_sample = int(amplitude * sin(t))
         else:  # "high_power"
             # High power signal
-            t = i / num_samples * 2 * math.pi
+            t = i / num_samples * tau
             amplitude = 8000
-            i_sample = int(amplitude * math.cos(t))
-            q_sample = int(amplitude * math.sin(t))
+            i_sample = int(amplitude * cos(t))
+            q_sample = int(amplitude * sin(t))
         
         # Clamp to 16-bit signed range
         i_sample = max(-32768, min(32767, i_sample))
         q_sample = max(-32768, min(32767, q_sample))
         
-        samples.append(struct.pack('>hh', i_sample, q_sample))
+        pack_into(samples, i * 4, i_sample, q_sample)
     
-    return b''.join(samples)
+    return bytes(samples)
 
-def create_oran_packet(rtc_id=0x1234, seq_id=0, frame_id=0, symbol_id=0, pattern="sine"):
-    """Create a complete O-RAN packet with specific IQ pattern"""
+def create_oran_packet(rtc_id=0x1234, seq_id=0, frame_id=0, symbol_id=0, pattern="sine", iq_data=None):
+    """Create a complete O-RAN packet with specific IQ pattern (or precomputed iq_data)"""
     # Create headers
     eth_header = create_ethernet_header()
     oran_header = create_oran_header(frame_id=frame_id, symbol_id=symbol_id)
-    iq_data = generate_iq_samples_with_pattern(273*12, pattern)
+    if iq_data is None:
+        iq_data = generate_iq_samples_with_pattern(273*12, pattern)
     
     # Calculate eCPRI payload size (O-RAN header + IQ data)
     payload_size = len(oran_header) + len(iq_data)
@@ -188,33 +157,35 @@ def create_test_pcap_rms_variations(filename="test_rms_variations.pcap"):
 
 def create_test_pcap_frame_sequence(filename="test_frame_sequence.pcap"):
     """Test with frame/slot/symbol progression"""
-    with open(filename, 'wb') as f:
-        f.write(create_pcap_global_header())
+    base_time = time.time()
+    
+    # The sine pattern is deterministic, so every packet shares one IQ payload
+    iq_data = generate_iq_samples_with_pattern(273*12, "sine")
+    
+    # Generate packets for 2 frames, 10 slots each, 14 symbols each
+    grid = list(product(range(2), range(10), range(14)))
+    records = [create_pcap_global_header()]
+    for seq_id, (frame, slot, symbol) in enumerate(grid):
+        packet_data = create_oran_packet(
+            rtc_id=0x3000,
+            seq_id=seq_id,
+            frame_id=frame,
+            symbol_id=symbol,
+            iq_data=iq_data
+        )
         
-        base_time = time.time()
-        packet_count = 0
+        # Realistic timing: 1ms per slot, symbols within slot
+        packet_timestamp = base_time + (frame * 10 + slot) * 0.001 + symbol * 0.00007
+        packet_header = create_packet_header(packet_data, packet_timestamp)
         
-        # Generate packets for 2 frames, 10 slots each, 14 symbols each
-        for frame in range(2):
-            for slot in range(10):
-                for symbol in range(14):
-                    packet_data = create_oran_packet(
-                        rtc_id=0x3000,
-                        seq_id=packet_count,
-                        frame_id=frame,
-                        symbol_id=symbol,
-                        pattern="sine"
-                    )
-                    
-                    # Realistic timing: 1ms per slot, symbols within slot
-                    packet_timestamp = base_time + (frame * 10 + slot) * 0.001 + symbol * 0.00007
-                    packet_header = create_packet_header(packet_data, packet_timestamp)
-                    
-                    f.write(packet_header)
-                    f.write(packet_data)
-                    packet_count += 1
+        records.append(packet_header)
+        records.append(packet_data)
+    
+    # Write the whole capture at once
+    with open(filename, 'wb') as f:
+        f.write(b''.join(records))
     
-    print(f"Created {filename}: {packet_count} packets in frame/slot/symbol sequence (2 frames × 10 slots × 14 symbols)")
+    print(f"Created {filename}: {len(grid)} packets in frame/slot/symbol sequence (2 frames × 10 slots × 14 symbols)")
 
 def create_all_test_samples():
     """Create all test PCAP samples"""
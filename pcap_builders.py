@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Shared PCAP / Ethernet / eCPRI / O-RAN header builders
+Used by create_sample_pcap.py, create_test_samples.py and create_large_pcap.py
+"""
+
+import struct
+
+# Precompiled header layouts (avoids re-parsing the format string per packet)
+PCAP_GLOBAL_HDR = struct.Struct('<LHHLLLL')
+PKT_HDR = struct.Struct('<LLLL')
+UINT16 = struct.Struct('>H')
+ECPRI = struct.Struct('>BHHH')
+ORAN_BYTES = struct.Struct('>BBBB')
+ORAN_SECTION = struct.Struct('>L')
+IQ_SAMPLE = struct.Struct('>hh')  # One interleaved I/Q pair
+
+# Every packet uses the same MAC pair, so the Ethernet header is built once
+DEFAULT_SRC_MAC = "00:11:22:33:44:55"
+DEFAULT_DST_MAC = "aa:bb:cc:dd:ee:ff"
+ETH_HDR_DEFAULT = bytes.fromhex((DEFAULT_DST_MAC + DEFAULT_SRC_MAC).replace(':', '')) + UINT16.pack(0xaefe)
+
+def create_pcap_global_header():
+    """Create PCAP global header"""
+    magic = 0xa1b2c3d4  # Little endian
+    version_major = 2
+    version_minor = 4
+    thiszone = 0
+    sigfigs = 0
+    snaplen = 65535
+    network = 1  # Ethernet
+
+    return PCAP_GLOBAL_HDR.pack(magic, version_major, version_minor,
+                                thiszone, sigfigs, snaplen, network)
+
+def create_packet_header(packet_data, timestamp):
+    """Create packet header"""
+    ts_sec = int(timestamp)
+    ts_usec = int((timestamp - ts_sec) * 1000000)
+    caplen = len(packet_data)
+    origlen = caplen
+
+    return PKT_HDR.pack(ts_sec, ts_usec, caplen, origlen)
+
+def create_ethernet_header(src_mac=DEFAULT_SRC_MAC, dst_mac=DEFAULT_DST_MAC):
+    """Create Ethernet header"""
+    if src_mac == DEFAULT_SRC_MAC and dst_mac == DEFAULT_DST_MAC:
+        return ETH_HDR_DEFAULT
+
+    def mac_to_bytes(mac_str):
+        return bytes.fromhex(mac_str.replace(':', ''))
+
+    dst = mac_to_bytes(dst_mac)
+    src = mac_to_bytes(src_mac)
+    ethertype = 0xaefe  # eCPRI
+
+    return dst + src + UINT16.pack(ethertype)
+
+def create_ecpri_header(message_type=0, rtc_id=0x1234, seq_id=0, payload_size=0):
+    """Create eCPRI header"""
+    # Byte 0: Version(4) + Reserved(1) + C(1) + Message Type(2)
+    byte0 = (1 << 4) | (0 << 3) | (0 << 2) | (message_type & 0x03)
+
+    header = ECPRI.pack(byte0, payload_size, rtc_id, seq_id)
+
+    return header
+
+def create_oran_header(frame_id=0, subframe_id=0, slot_id=0, symbol_id=0,
+                      section_id=0, start_prbu=0, num_prbu=273):
+    """Create O-RAN U-plane header"""
+    # Byte 0: dataDirection(1) + payloadVersion(3) + filterIndex(4)
+    byte0 = (0 << 7) | (1 << 4) | (0 & 0x0f)
+
+    # Byte 2: subframeId(4) + slotId(4)
+    byte2 = (subframe_id << 4) | (slot_id & 0x0f)
+
+    # Byte 3: symbolId(6) + reserved(2)
+    byte3 = (symbol_id << 2) | 0
+
+    # Section fields (4 bytes)
+    # sectionId(12) + rb(1) + symInc(1) + startPrbu(10) + numPrbu(8)
+    section_fields = (section_id << 20) | (1 << 19) | (0 << 18) | (start_prbu << 8) | num_prbu
+
+    return ORAN_BYTES.pack(byte0, frame_id, byte2, byte3) + ORAN_SECTION.pack(section_fields)